@@ -1,5 +1,5 @@
 from .client import Client
-from .async_client import AsyncClient
+from .async_client import AsyncClient, enable_uvloop
 
 __version__ = "0.1.2"
-__all__ = ["Client", "AsyncClient"]
\ No newline at end of file
+__all__ = ["Client", "AsyncClient", "enable_uvloop"]
\ No newline at end of file
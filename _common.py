@@ -0,0 +1,230 @@
+"""
+Shared helpers for the Docker Model Runner sync and async clients.
+
+This private module holds the pure, transport-independent pieces used by both
+client.py and async_client.py: JSON encoding, the server-sent events (SSE)
+stream parser, local tool_choice emulation, and reconstruction of a full chat
+completion from streamed chunks. Fixes here apply to both clients at once.
+"""
+
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    msgspec = None
+    MSGSPEC_AVAILABLE = False
+
+from typing import Optional, Dict, Any, Callable, List
+
+# Request bodies are pre-serialized with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Server-sent event markers, matched against raw bytes in the stream parser
+_SSE_DATA_PREFIX = b'data: '
+_SSE_DATA_PREFIX_LEN = len(_SSE_DATA_PREFIX)
+_SSE_DONE = b'[DONE]'
+
+if MSGSPEC_AVAILABLE:
+    class _ChunkDelta(msgspec.Struct):
+        """Text delta of a streamed chat completion choice."""
+        content: Optional[str] = None
+
+    class _ChunkChoice(msgspec.Struct):
+        """Streamed chat completion choice; other fields are skipped while decoding."""
+        delta: _ChunkDelta = msgspec.field(default_factory=_ChunkDelta)
+
+    class _ChatChunk(msgspec.Struct):
+        """Streamed chat completion chunk, decoded only as far as stream_text() needs."""
+        choices: List[_ChunkChoice] = msgspec.field(default_factory=list)
+
+    _CHAT_CHUNK_DECODER = msgspec.json.Decoder(_ChatChunk)
+    _DECODE_ERRORS = (orjson.JSONDecodeError, msgspec.DecodeError)
+else:
+    _DECODE_ERRORS = (orjson.JSONDecodeError,)
+
+class _SSEParser:
+    """Incremental parser turning raw server-sent event bytes into decoded events.
+    
+    Network chunks are fed in as they arrive; only complete lines are parsed.
+    Lines are matched as bytes and handed to the JSON decoder without an
+    intermediate str, and the newline search resumes where the previous
+    chunk left off so large events are scanned linearly.
+    
+    Attributes:
+        done (bool): True once the [DONE] sentinel has been received
+    
+    Example:
+        >>> parser = _SSEParser()
+        >>> parser.feed(b'data: {"a": 1}\\r\\n\\ndata: {"a"')
+        [{'a': 1}]
+        >>> parser.feed(b': 2}\\ndata: [DONE]\\n')
+        [{'a': 2}]
+        >>> parser.done
+        True
+    """
+    def __init__(self, decode: Callable[[bytes], Any] = orjson.loads):
+        """Initialize the parser.
+        
+        Args:
+            decode: Callable decoding one JSON payload from bytes
+        """
+        self.decode = decode
+        self.done = False
+        self._buffer = bytearray()
+        self._scan = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Parse a chunk of the response body.
+        
+        Args:
+            chunk: Raw bytes as received from the network
+        
+        Returns:
+            List of events decoded from the lines completed by this chunk.
+            Lines that are not valid JSON are skipped.
+        """
+        buffer = self._buffer
+        buffer.extend(chunk)
+        events = []
+        newline = buffer.find(b'\n', self._scan)
+        while newline != -1:
+            # rstrip drops the '\r' of CRLF-terminated events
+            line = buffer[:newline].rstrip()
+            del buffer[:newline + 1]
+            newline = buffer.find(b'\n')
+            if not line:
+                continue
+            if line.startswith(_SSE_DATA_PREFIX):
+                # bytes.removeprefix needs Python 3.9 and always copies a bytearray
+                line = line[_SSE_DATA_PREFIX_LEN:]
+                if line == _SSE_DONE:
+                    self.done = True
+                    return events
+            # The JSON decoder reads UTF-8 bytes directly
+            try:
+                events.append(self.decode(line))
+            except _DECODE_ERRORS:
+                continue
+        # The leftover partial line has no newline, so don't rescan it
+        self._scan = len(buffer)
+        return events
+
+def _apply_tool_choice(data: Dict[str, Any], tool_choice: Optional[str]) -> None:
+    """Apply the tool_choice setting to a chat request payload in place.
+    
+    The Docker Model Runner server doesn't support tool_choice, so it is
+    emulated locally: "none" strips the tools and "always" instructs the
+    model in the last user message to call one of them.
+    
+    Args:
+        data: The chat completion request payload
+        tool_choice: The tool choice mode ("auto", "none", "always") or None
+    """
+    if tool_choice is None or tool_choice == "auto":
+        # Send tools and let model decide (default behavior)
+        return
+    if tool_choice == "none":
+        data.pop("tools", None)
+        return
+    if tool_choice == "always" and "tools" in data:
+        tool_names = [tool["function"]["name"] for tool in data["tools"] if tool.get("type") == "function"]
+        if tool_names:  # Only modify if there are tools
+            tool_names_str = ", ".join(tool_names)
+            # Modify the last user message
+            for msg in reversed(data["messages"]):
+                if msg["role"] == "user":
+                    msg["content"] += f" Use one of these tools: {tool_names_str}. Choose the most appropriate tool and provide only the tool call, no additional text."
+                    break
+
+class _StreamAccumulator:
+    """Rebuilds a full chat completion response from streamed chunks.
+    
+    Content and reasoning_content deltas are joined, and tool_calls deltas
+    are merged by their index: the id, type and function name come from the
+    first fragment of each call and the argument fragments are concatenated.
+    
+    Example:
+        >>> acc = _StreamAccumulator()
+        >>> acc.add({"choices": [{"delta": {"content": "Hi"}}]})
+        >>> acc.add({"choices": [{"delta": {"tool_calls": [{"index": 0, "id": "call_1", "type": "function",
+        ...     "function": {"name": "get_weather", "arguments": '{"location": '}}]}}]})
+        >>> acc.add({"choices": [{"delta": {"tool_calls": [{"index": 0,
+        ...     "function": {"arguments": '"Paris"}'}}]}, "finish_reason": "tool_calls"}]})
+        >>> message = acc.build("ai/model_name")["choices"][0]["message"]
+        >>> message["content"], message["tool_calls"]
+        ('Hi', [{'id': 'call_1', 'type': 'function', 'function': {'name': 'get_weather', 'arguments': '{"location": "Paris"}'}}])
+        >>> acc.build("ai/model_name")["choices"][0]["finish_reason"]
+        'tool_calls'
+    """
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.content_parts: List[str] = []
+        self.reasoning_parts: List[str] = []
+        self.tool_calls: Dict[int, Dict[str, Any]] = {}
+        self.finish_reason: Optional[str] = None
+        self.last_chunk: Optional[Dict[str, Any]] = None
+
+    def add(self, chunk: Dict[str, Any]) -> None:
+        """Collect the deltas of one streamed chat completion chunk.
+        
+        Args:
+            chunk: A decoded streaming chunk
+        """
+        self.last_chunk = chunk
+        choices = chunk.get("choices")
+        if not choices:
+            return
+        choice = choices[0]
+        delta = choice.get("delta") or {}
+        if delta.get("content"):
+            self.content_parts.append(delta["content"])
+        if delta.get("reasoning_content"):
+            self.reasoning_parts.append(delta["reasoning_content"])
+        for fragment in delta.get("tool_calls") or ():
+            function = fragment.get("function") or {}
+            tool_call = self.tool_calls.get(fragment.get("index", 0))
+            if tool_call is None:
+                tool_call = {
+                    "id": fragment.get("id"),
+                    "type": fragment.get("type", "function"),
+                    "function": {"name": function.get("name"), "arguments": ""},
+                }
+                self.tool_calls[fragment.get("index", 0)] = tool_call
+            if function.get("arguments"):
+                tool_call["function"]["arguments"] += function["arguments"]
+        if choice.get("finish_reason"):
+            self.finish_reason = choice["finish_reason"]
+
+    def build(self, model: str) -> Dict[str, Any]:
+        """Assemble a chat completion response from the collected deltas.
+        
+        The result has the same shape as a non-streaming chat completion, so
+        callers of stream() get the full message without a second request.
+        
+        Args:
+            model: The model requested, used if the chunks don't report one
+            
+        Returns:
+            Dict in OpenAI chat completion format
+        """
+        message = {"role": "assistant", "content": "".join(self.content_parts)}
+        if self.reasoning_parts:
+            message["reasoning_content"] = "".join(self.reasoning_parts)
+        if self.tool_calls:
+            message["tool_calls"] = [self.tool_calls[index] for index in sorted(self.tool_calls)]
+        last_chunk = self.last_chunk or {}
+        full_response = {
+            "id": last_chunk.get("id"),
+            "object": "chat.completion",
+            "created": last_chunk.get("created"),
+            "model": last_chunk.get("model", model),
+            "choices": [{"index": 0, "message": message, "finish_reason": self.finish_reason}],
+        }
+        if last_chunk.get("usage"):
+            full_response["usage"] = last_chunk["usage"]
+        return full_response
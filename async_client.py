@@ -18,6 +18,9 @@ Classes:
     MCPEnvironmentWarning: Warning for MCP environment issues
     MCPEnvironmentError: Error for critical MCP failures
 
+Functions:
+    enable_uvloop: Opt in to the faster uvloop event loop when it is installed
+
 Example:
     >>> async with AsyncClient(api_key="your_key") as client:
     ...     response = await client.chat.completions.create(
@@ -34,13 +37,33 @@ except ImportError:
     Client = None
     MCP_AVAILABLE = False
 
+import asyncio
 import json
 import aiohttp
-from typing import Optional, Dict, Any, AsyncIterator, List, Literal, Union
+from typing import Optional, Dict, Any, Callable, AsyncIterator, List, Literal, Union
 from typing_extensions import TypedDict
 import warnings
+import weakref
 import sys
 from io import UnsupportedOperation
+from urllib.parse import urlparse
+
+from ._common import (
+    MSGSPEC_AVAILABLE,
+    orjson,
+    _JSON_HEADERS,
+    _SSEParser,
+    _apply_tool_choice,
+    _StreamAccumulator,
+)
+if MSGSPEC_AVAILABLE:
+    from ._common import _CHAT_CHUNK_DECODER
+
+# Connection pools shared by AsyncClient sessions, one per event loop, see _acquire_shared_connector()
+_SHARED_CONNECTORS: Dict[asyncio.AbstractEventLoop, "_SharedConnector"] = {}
+
+# Set once stdout/stderr/locale have been configured for UTF-8 in this process
+_UTF8_CONFIGURED = False
 
 class MCPEnvironmentWarning(UserWarning):
     """Warning raised when MCP tools are used in environments that may cause issues.
@@ -134,6 +157,92 @@ def _check_mcp_environment():
             stacklevel=3
         )
 
+def enable_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop implementation if it is installed.
+    
+    uvloop is a libuv-based drop-in replacement for the default event loop
+    that speeds up socket I/O for workloads with many small requests. The
+    event loop policy is process-wide, so this is left to the application
+    to opt in to rather than done on import. Call it before asyncio.run().
+    
+    Returns:
+        bool: True if uvloop was enabled, False if it isn't installed
+        
+    Example:
+        >>> from docker_model_runner import enable_uvloop
+        >>> enable_uvloop()
+        >>> asyncio.run(main())
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+class _SharedConnector:
+    """A TCPConnector shared by the AsyncClient sessions of one event loop.
+    
+    Attributes:
+        loop (asyncio.AbstractEventLoop): The event loop the connector is bound to
+        connector (aiohttp.TCPConnector): The shared connection pool
+        users (int): Number of open client sessions using the connector
+    """
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """Create the connector for the given (running) event loop.
+        
+        Args:
+            loop: The running event loop
+        """
+        self.loop = loop
+        self.connector = aiohttp.TCPConnector(
+            limit=256,
+            limit_per_host=64,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+            ttl_dns_cache=300,
+        )
+        self.users = 0
+
+def _acquire_shared_connector() -> _SharedConnector:
+    """Register a new user of the running event loop's shared connector.
+    
+    Sharing one connector lets every client reuse the same keep-alive pool
+    and DNS cache. A connector is bound to the event loop it was created on,
+    so each loop gets its own. Every call must be paired with a call to
+    _release_shared_connector(), which closes the connector once its last
+    user is gone.
+    
+    Must be called from a coroutine running on the target event loop.
+    
+    Returns:
+        _SharedConnector: The shared connector entry for the running loop
+    """
+    loop = asyncio.get_running_loop()
+    # Loops that were closed while clients were still open (never closed) can't
+    # run the connector's cleanup anymore, so their pools are just dropped
+    for stale_loop in [other for other in _SHARED_CONNECTORS if other.is_closed()]:
+        del _SHARED_CONNECTORS[stale_loop]
+    # No await between the check and the assignment, so no lock is needed
+    shared = _SHARED_CONNECTORS.get(loop)
+    if shared is None or shared.connector.closed:
+        shared = _SHARED_CONNECTORS[loop] = _SharedConnector(loop)
+    shared.users += 1
+    return shared
+
+async def _release_shared_connector(shared: _SharedConnector) -> None:
+    """Unregister a user of a shared connector, closing it after the last one.
+    
+    Args:
+        shared: The entry returned by _acquire_shared_connector()
+    """
+    shared.users -= 1
+    if shared.users > 0:
+        return
+    if _SHARED_CONNECTORS.get(shared.loop) is shared:
+        del _SHARED_CONNECTORS[shared.loop]
+    await shared.connector.close()
+
 class Message(TypedDict, total=False):
     """Represents a chat message in OpenAI-compatible format.
     
@@ -165,36 +274,23 @@ class Message(TypedDict, total=False):
     content: Union[str, List[Dict[str, Any]]]  # Support both string and OpenAI vision format
     # Optional fields like tool_calls can be added if needed
 
-class AsyncStream:
-    """Asynchronous iterator for streaming responses from the API.
-    
-    This class wraps an AsyncIterator to provide a clean interface for
-    consuming streaming responses from chat completions.
-    
-    Attributes:
-        aiterator (AsyncIterator[Dict[str, Any]]): The underlying async iterator
-        
-    Example:
-        >>> async for chunk in stream:
-        ...     print(chunk)
-    """
-    def __init__(self, aiterator: AsyncIterator[Dict[str, Any]]):
-        """Initialize the AsyncStream.
-        
-        Args:
-            aiterator: The async iterator to wrap
-        """
-        self.aiterator = aiterator
-
-    def __aiter__(self):
-        """Return the async iterator."""
-        return self.aiterator
-
 class AsyncClient:
     def __init__(self, base_url: str = "http://localhost:12434/engines/v1", api_key: Optional[str] = None):
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
+        self._default_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        # Endpoint URLs are built once here instead of on every request
+        self._url_chat = f"{self.base_url}/chat/completions"
+        self._url_completions = f"{self.base_url}/completions"
+        self._url_embeddings = f"{self.base_url}/embeddings"
+        self._url_models = f"{self.base_url}/models"
+        # Model management endpoints live at the server root, not under the engine path
+        parsed = urlparse(self.base_url)
+        self._mgmt_base = f"{parsed.scheme}://{parsed.netloc}"
+        self._url_models_root = f"{self._mgmt_base}/models"
         self.session = None
+        self._finalizer = None
+        self._shared_connector = None
         
         # Automatically configure UTF-8 encoding for proper character support
         self._configure_utf8()
@@ -209,7 +305,15 @@ class AsyncClient:
         - Reconfigure stdout and stderr for UTF-8 encoding
         - Set appropriate locale settings for Windows
         - Gracefully handle any configuration failures
+        
+        The configuration is process-wide, so it only runs for the first
+        client created; later clients skip it.
         """
+        global _UTF8_CONFIGURED
+        if _UTF8_CONFIGURED:
+            return
+        _UTF8_CONFIGURED = True
+        
         import sys
         import locale
         
@@ -238,6 +342,55 @@ class AsyncClient:
                     # If locale setting fails, continue anyway
                     pass
 
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp ClientSession, creating it on first use.
+        
+        A single pooled session is reused by every request made through this
+        client so TCP connections are kept alive between calls instead of
+        being re-established per request. The underlying connector is shared
+        with every other open AsyncClient on the same event loop and is closed
+        when the last of them is closed.
+        
+        Returns:
+            aiohttp.ClientSession: The open session for this client
+        """
+        if self.session is None or self.session.closed:
+            # Swap in the new state before awaiting anything so concurrent
+            # callers see the fresh session instead of releasing twice
+            old_connector, self._shared_connector = self._shared_connector, None
+            self._shared_connector = _acquire_shared_connector()
+            # The connector is shared, so closing this session must not close it;
+            # close() releases it instead
+            self.session = aiohttp.ClientSession(
+                headers=self._default_headers,
+                connector=self._shared_connector.connector,
+                connector_owner=False,
+            )
+            if self._finalizer is not None:
+                self._finalizer.detach()
+            self._finalizer = weakref.finalize(self, self._warn_unclosed, self.session)
+            if old_connector is not None:
+                # The previous session was closed directly; give back its connector
+                await _release_shared_connector(old_connector)
+        return self.session
+
+    @staticmethod
+    def _warn_unclosed(session: aiohttp.ClientSession):
+        """Warn when a client is garbage-collected with its session still open.
+        
+        Registered through weakref.finalize, so it must not reference the
+        client itself.
+        
+        Args:
+            session: The session created by the collected client
+        """
+        if session is not None and not session.closed:
+            warnings.warn(
+                "AsyncClient garbage-collected without close(); "
+                "call await client.close() or use 'async with'.",
+                ResourceWarning,
+            )
+
     async def __aenter__(self):
         """Async context manager entry.
         
@@ -246,10 +399,7 @@ class AsyncClient:
         Returns:
             AsyncClient: The client instance for use in the context
         """
-        headers = {}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
-        self.session = aiohttp.ClientSession(headers=headers)
+        await self._get_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -262,23 +412,7 @@ class AsyncClient:
             exc_val: Exception value (if any) 
             exc_tb: Exception traceback (if any)
         """
-        if self.session:
-            await self.session.close()
-            self.session = None
-
-    def __del__(self):
-        """Destructor to ensure session cleanup.
-        
-        Attempts to close the session if it exists and is still open.
-        Uses asyncio loop detection to handle cleanup properly.
-        """
-        if self.session and not self.session.closed:
-            try:
-                import asyncio
-                loop = asyncio.get_running_loop()
-                loop.create_task(self.session.close())
-            except:
-                pass
+        await self.close()
 
     async def close(self):
         """Manually close the client session.
@@ -289,6 +423,12 @@ class AsyncClient:
         if self.session:
             await self.session.close()
             self.session = None
+        if self._shared_connector is not None:
+            await _release_shared_connector(self._shared_connector)
+            self._shared_connector = None
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
     @property
     def chat(self):
@@ -358,31 +498,38 @@ class AsyncChatCompletions:
         else:
             return ""
 
-    async def create(self, model: str, messages: List[Message], tool_choice: Optional[Literal["auto", "none", "always"]] = None, thinking_effort: Literal["low", "medium", "high", "none"] = "none", **kwargs):
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
+    def _apply_thinking_effort(self, messages: List[Message], thinking_effort: Optional[Literal["low", "medium", "high", "none"]]) -> None:
+        """Add the thinking instruction for thinking_effort to the messages in place.
         
-        url = f"{self.client.base_url}/chat/completions"
+        The instruction is appended to the first system message, or inserted
+        as a new system message at the beginning if there is none.
+        
+        Args:
+            messages: The conversation messages to modify
+            thinking_effort: The level of thinking effort, or None to skip
+        """
+        if not thinking_effort:
+            return
+        thinking_instruction = self._get_thinking_instruction(thinking_effort)
+        if not thinking_instruction:
+            return
+        for msg in messages:
+            if msg.get("role") == "system":
+                # Append thinking instruction to existing system message
+                msg["content"] += " " + thinking_instruction
+                return
+        # Add new system message at the beginning
+        messages.insert(0, {"role": "system", "content": thinking_instruction})
+
+    async def create(self, model: str, messages: List[Message], tool_choice: Optional[Literal["auto", "none", "always"]] = None, thinking_effort: Literal["low", "medium", "high", "none"] = "none", stream: bool = False, **kwargs) -> Union[Dict[str, Any], AsyncIterator[Dict[str, Any]]]:
+        session = await self.client._get_session()
+        url = self.client._url_chat
         data = {"model": model, "messages": messages, **kwargs}
+        if stream:
+            data["stream"] = True
         
         # Handle thinking_effort parameter
-        if thinking_effort:
-            thinking_instruction = self._get_thinking_instruction(thinking_effort)
-            if thinking_instruction:
-                # Check if there's already a system message
-                system_message_exists = any(msg.get("role") == "system" for msg in data["messages"])
-                if system_message_exists:
-                    # Append thinking instruction to existing system message
-                    for msg in data["messages"]:
-                        if msg.get("role") == "system":
-                            msg["content"] += " " + thinking_instruction
-                            break
-                else:
-                    # Add new system message at the beginning
-                    data["messages"].insert(0, {"role": "system", "content": thinking_instruction})
+        self._apply_thinking_effort(data["messages"], thinking_effort)
         
         # Convert OpenAI vision format to Docker Model Runner format
         for message in data["messages"]:
@@ -435,35 +582,12 @@ class AsyncChatCompletions:
             data["tools"] = function_tools
         
         # Handle tool_choice locally
-        if tool_choice == "none":
-            data.pop("tools", None)
-        elif tool_choice == "always":
-            if "tools" in data:
-                tool_names = []
-                for tool in data["tools"]:
-                    if tool.get("type") == "function":
-                        name = tool["function"]["name"]
-                        if name in mcp_tools:
-                            # Use actual tool name, not server label
-                            tool_names.append(name)
-                        else:
-                            tool_names.append(name)
-                if tool_names:  # Only modify if there are tools
-                    tool_names_str = ", ".join(tool_names)
-                    # Modify the last user message
-                    for msg in reversed(data["messages"]):
-                        if msg["role"] == "user":
-                            msg["content"] += f" Use one of these tools: {tool_names_str}. Choose the most appropriate tool and provide only the tool call, no additional text."
-                            break
-        elif tool_choice == "auto":
-            # Send tools and let model decide (default behavior)
-            pass
-        # Remove tool_choice from data as server doesn't support it
-        data.pop("tool_choice", None)
+        _apply_tool_choice(data, tool_choice)
         
-        if kwargs.get("stream", False):
-            return AsyncStream(self._stream_response(url, data))
-        async with self.client.session.post(url, json=data) as response:
+        if stream:
+            # _stream_response is already a generator, so return it directly
+            return self._stream_response(url, data)
+        async with session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
             result = await response.json()
             
@@ -546,7 +670,7 @@ Remember: Return ONLY the JSON object, nothing else. This format works for ALL M
                         follow_up_data = {"model": model, "messages": follow_up_messages}
                         if "response_format" in kwargs:
                             follow_up_data["response_format"] = kwargs["response_format"]
-                        async with self.client.session.post(url, json=follow_up_data) as follow_up_response:
+                        async with session.post(url, data=orjson.dumps(follow_up_data), headers=_JSON_HEADERS) as follow_up_response:
                             follow_up_response.raise_for_status()
                             result = await follow_up_response.json()
 
@@ -561,84 +685,104 @@ Remember: Return ONLY the JSON object, nothing else. This format works for ALL M
             
             return result
 
+    async def create_batch(self, model: str, messages_list: List[List[Message]], max_concurrency: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Create chat completions for several conversations concurrently.
+        
+        Args:
+            model: The model identifier to use
+            messages_list: One message list per chat completion
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional parameters passed to each create() call
+            
+        Returns:
+            List of API responses in the same order as ``messages_list``
+            
+        Example:
+            >>> responses = await client.chat.completions.create_batch(
+            ...     model="ai/model_name",
+            ...     messages_list=[
+            ...         [{"role": "user", "content": "Hello!"}],
+            ...         [{"role": "user", "content": "How are you?"}],
+            ...     ]
+            ... )
+        """
+        if kwargs.get("stream", False):
+            raise ValueError("create_batch does not support streaming; use stream() per conversation instead")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def complete(messages: List[Message]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create(model=model, messages=messages, **kwargs)
+
+        return await asyncio.gather(*[complete(messages) for messages in messages_list])
+
     async def stream(self, model: str, messages: List[Message], **kwargs):
         """Async stream method that yields chunks and accumulates reasoning content properly"""
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        url = f"{self.client.base_url}/chat/completions"
+        url = self.client._url_chat
         data = {"model": model, "messages": messages, "stream": True,  **kwargs}
         
         # Handle thinking_effort parameter for streaming
         thinking_effort = kwargs.get("thinking_effort", "none")
-        if thinking_effort:
-            thinking_instruction = self._get_thinking_instruction(thinking_effort)
-            if thinking_instruction:
-                # Check if there's already a system message
-                system_message_exists = any(msg.get("role") == "system" for msg in data["messages"])
-                if system_message_exists:
-                    # Append thinking instruction to existing system message
-                    for msg in data["messages"]:
-                        if msg.get("role") == "system":
-                            msg["content"] += " " + thinking_instruction
-                            break
-                else:
-                    # Add new system message at the beginning
-                    data["messages"].insert(0, {"role": "system", "content": thinking_instruction})
-            # Remove thinking_effort from kwargs as it's not a server parameter
-            kwargs.pop("thinking_effort", None)
-        
-        # First yield all streaming chunks
+        self._apply_thinking_effort(data["messages"], thinking_effort)
+        # Remove thinking_effort from kwargs as it's not a server parameter
+        kwargs.pop("thinking_effort", None)
+        
+        # First yield all streaming chunks, collecting their deltas
+        accumulator = _StreamAccumulator()
         async for chunk in self._stream_response(url, data):
+            accumulator.add(chunk)
             yield chunk
         
-        # Then yield the full response (non-streaming) to get complete reasoning content
-        data_no_stream = {**data}
-        data_no_stream.pop('stream', None)  # Remove stream parameter if present
-        async with self.client.session.post(url, json=data_no_stream) as response:
-            response.raise_for_status()
-            full_response = await response.json()
-            yield full_response
+        # Then yield the full response, rebuilt locally instead of re-running the generation
+        yield accumulator.build(model)
 
-    async def _stream_response(self, url: str, data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
+    async def stream_text(self, model: str, messages: List[Message], thinking_effort: Literal["low", "medium", "high", "none"] = "none", **kwargs) -> AsyncIterator[str]:
+        """Stream only the text deltas of a chat completion.
+        
+        Unlike stream(), chunks are not returned as dicts. When msgspec is
+        installed each chunk is decoded straight into a small typed struct,
+        skipping every field except the delta content.
         
-        async with self.client.session.post(url, json=data) as response:
+        Args:
+            model: The model identifier to use
+            messages: The conversation messages
+            thinking_effort: The level of thinking effort, applied to the
+                messages the same way as in create() and stream()
+            **kwargs: Additional parameters for the API request
+            
+        Yields:
+            str: The content delta of each chunk ("" for chunks without text)
+            
+        Example:
+            >>> async for text in client.chat.completions.stream_text(
+            ...     model="ai/model_name",
+            ...     messages=[{"role": "user", "content": "Hello!"}]
+            ... ):
+            ...     print(text, end="", flush=True)
+        """
+        url = self.client._url_chat
+        self._apply_thinking_effort(messages, thinking_effort)
+        data = {"model": model, "messages": messages, **kwargs, "stream": True}
+        if MSGSPEC_AVAILABLE:
+            async for chunk in self._stream_response(url, data, decode=_CHAT_CHUNK_DECODER.decode):
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        else:
+            async for chunk in self._stream_response(url, data):
+                choices = chunk.get("choices")
+                if choices:
+                    yield choices[0].get("delta", {}).get("content") or ""
+
+    async def _stream_response(self, url: str, data: Dict[str, Any], decode: Callable[[bytes], Any] = orjson.loads) -> AsyncIterator[Any]:
+        session = await self.client._get_session()
+        async with session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
-            # Ensure proper encoding
-            response.encoding = 'utf-8'
-            buffer = ""
-            async for chunk in response.content.iter_chunked(1024):
-                # Explicitly decode as UTF-8
-                decoded_chunk = chunk.decode('utf-8', errors='replace')
-                buffer += decoded_chunk
-                lines = buffer.split('\n')
-                buffer = lines.pop()
-                for line in lines:
-                    line = line.strip()
-                    if line:
-                        if line.startswith('data: '):
-                            data_str = line[6:]
-                            if data_str == '[DONE]':
-                                return
-                            try:
-                                chunk_data = json.loads(data_str)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                continue
-                        else:
-                            try:
-                                chunk_data = json.loads(line)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                continue
+            parser = _SSEParser(decode)
+            async for chunk in response.content.iter_any():
+                for event in parser.feed(chunk):
+                    yield event
+                if parser.done:
+                    return
 
 class AsyncCompletions:
     """Text completions interface for async client.
@@ -675,15 +819,10 @@ class AsyncCompletions:
             ... )
             >>> print(response["choices"][0]["text"])
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        url = f"{self.client.base_url}/completions"
+        session = await self.client._get_session()
+        url = self.client._url_completions
         data = {"model": model, "prompt": prompt, **kwargs}
-        async with self.client.session.post(url, json=data) as response:
+        async with session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
             return await response.json()
 
@@ -722,18 +861,52 @@ class AsyncEmbeddings:
             ... )
             >>> embeddings = response["data"]
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        url = f"{self.client.base_url}/embeddings"
+        session = await self.client._get_session()
+        url = self.client._url_embeddings
         data = {"model": model, "input": input, **kwargs}
-        async with self.client.session.post(url, json=data) as response:
+        async with session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
             return await response.json()
 
+    async def create_batch(self, model: str, inputs: List[str], batch_size: int = 64, max_concurrency: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Create embeddings for many texts using concurrent batched requests.
+        
+        The inputs are split into batches of ``batch_size`` texts, and up to
+        ``max_concurrency`` batches are sent to the server at the same time.
+        
+        Args:
+            model: The embedding model identifier to use
+            inputs: List of text strings to embed
+            batch_size: Maximum number of texts sent in a single request
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional parameters for each API request
+            
+        Returns:
+            List of embedding objects in the same order as ``inputs``, with
+            each ``index`` referring to the position in ``inputs``
+            
+        Example:
+            >>> embeddings = await client.embeddings.create_batch(
+            ...     model="ai/embedding-model",
+            ...     inputs=["first text", "second text", "third text"]
+            ... )
+            >>> vectors = [item["embedding"] for item in embeddings]
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_batch(batch: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create(model=model, input=batch, **kwargs)
+
+        # asyncio.gather preserves task order, so results line up with inputs
+        results = await asyncio.gather(*[
+            embed_batch(inputs[i:i + batch_size]) for i in range(0, len(inputs), batch_size)
+        ])
+        embeddings = [item for result in results for item in result["data"]]
+        for index, item in enumerate(embeddings):
+            item["index"] = index
+        return embeddings
+
 class AsyncModels:
     """Model management interface for async client.
     
@@ -762,14 +935,9 @@ class AsyncModels:
             >>> for model in models["data"]:
             ...     print(model["id"])
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        url = f"{self.client.base_url}/models"
-        async with self.client.session.get(url) as response:
+        session = await self.client._get_session()
+        url = self.client._url_models
+        async with session.get(url) as response:
             response.raise_for_status()
             return await response.json()
 
@@ -786,14 +954,9 @@ class AsyncModels:
             >>> model_info = await client.models.retrieve("ai/model_name")
             >>> print(model_info["description"])
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        url = f"{self.client.base_url}/models/{model}"
-        async with self.client.session.get(url) as response:
+        session = await self.client._get_session()
+        url = f"{self.client._url_models}/{model}"
+        async with session.get(url) as response:
             response.raise_for_status()
             return await response.json()
 
@@ -811,16 +974,10 @@ class AsyncModels:
             This method uses the Docker Model Runner management API,
             not the standard OpenAI models endpoint.
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        base = self.client.base_url.replace("/engines/llama.cpp/v1", "")
-        url = f"{base}/models/create"
+        session = await self.client._get_session()
+        url = f"{self.client._url_models_root}/create"
         data = {"model": model, **kwargs}
-        async with self.client.session.post(url, json=data) as response:
+        async with session.post(url, data=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
             return await response.json()
 
@@ -837,14 +994,8 @@ class AsyncModels:
             This method uses the Docker Model Runner management API,
             not the standard OpenAI models endpoint.
         """
-        if self.client.session is None:
-            headers = {}
-            if self.client.api_key:
-                headers["Authorization"] = f"Bearer {self.client.api_key}"
-            self.client.session = aiohttp.ClientSession(headers=headers)
-        
-        base = self.client.base_url.replace("/engines/llama.cpp/v1", "")
-        url = f"{base}/models/{model}"
-        async with self.client.session.delete(url) as response:
+        session = await self.client._get_session()
+        url = f"{self.client._url_models_root}/{model}"
+        async with session.delete(url) as response:
             response.raise_for_status()
             return await response.json()
\ No newline at end of file
@@ -35,12 +35,28 @@ except ImportError:
     MCP_AVAILABLE = False
 
 import json
-import requests
-from typing import Optional, Dict, Any, Iterator, List, Literal, Union
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Iterator, List, Literal, Union
 from typing_extensions import TypedDict
 import warnings
 import sys
 from io import UnsupportedOperation
+from urllib.parse import urlparse
+
+from ._common import (
+    MSGSPEC_AVAILABLE,
+    orjson,
+    _JSON_HEADERS,
+    _SSEParser,
+    _apply_tool_choice,
+    _StreamAccumulator,
+)
+if MSGSPEC_AVAILABLE:
+    from ._common import _CHAT_CHUNK_DECODER
+
+# Set once stdout/stderr/locale have been configured for UTF-8 in this process
+_UTF8_CONFIGURED = False
 
 class MCPEnvironmentWarning(UserWarning):
     """Warning raised when MCP tools are used in environments that may cause issues."""
@@ -127,31 +143,6 @@ class Message(TypedDict, total=False):
     content: Union[str, List[Dict[str, Any]]]  # Support both string and OpenAI vision format
     # Optional fields like tool_calls can be added if needed
 
-class Stream:
-    """Iterator for streaming responses from the API.
-    
-    This class wraps an Iterator to provide a clean interface for
-    consuming streaming responses from chat completions.
-    
-    Attributes:
-        iterator (Iterator[Dict[str, Any]]): The underlying iterator
-        
-    Example:
-        >>> for chunk in stream:
-        ...     print(chunk)
-    """
-    def __init__(self, iterator: Iterator[Dict[str, Any]]):
-        """Initialize the Stream.
-        
-        Args:
-            iterator: The iterator to wrap
-        """
-        self.iterator = iterator
-
-    def __iter__(self):
-        """Return the iterator."""
-        return self.iterator
-
 class Client:
     """Synchronous client for Docker Model Runner API.
     
@@ -161,14 +152,14 @@ class Client:
     
     The client automatically handles:
     - UTF-8 encoding configuration
-    - HTTP session management
+    - HTTP session management with connection pooling and retries
     - MCP tool integration with environment warnings
     - Connection management
     
     Attributes:
         base_url (str): The base URL of the Docker Model Runner API
         api_key (Optional[str]): API key for authentication
-        session (requests.Session): HTTP session for requests
+        session (httpx.Client): Pooled HTTP client used for requests
         
     Example:
         Basic usage:
@@ -203,9 +194,25 @@ class Client:
         """
         self.base_url = base_url.rstrip('/')
         self.api_key = api_key
-        self.session = requests.Session()
-        if api_key:
-            self.session.headers.update({"Authorization": f"Bearer {api_key}"})
+        self._default_headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        # Endpoint URLs are built once here instead of on every request
+        self._url_chat = f"{self.base_url}/chat/completions"
+        self._url_completions = f"{self.base_url}/completions"
+        self._url_embeddings = f"{self.base_url}/embeddings"
+        self._url_models = f"{self.base_url}/models"
+        # Model management endpoints live at the server root, not under the engine path
+        parsed = urlparse(self.base_url)
+        self._mgmt_base = f"{parsed.scheme}://{parsed.netloc}"
+        self._url_models_root = f"{self._mgmt_base}/models"
+        # HTTP/2 is negotiated over TLS; plain http:// endpoints stay on HTTP/1.1.
+        # No custom transport is passed so HTTP(S)_PROXY/NO_PROXY are still honoured.
+        # Generations can take a while, so only the connect phase is bounded.
+        self.session = httpx.Client(
+            http2=True,
+            headers=self._default_headers,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=httpx.Timeout(None, connect=5.0),
+        )
         
         # Automatically configure UTF-8 encoding for proper character support
         self._configure_utf8()
@@ -220,7 +227,15 @@ class Client:
         - Reconfigure stdout and stderr for UTF-8 encoding
         - Set appropriate locale settings for Windows
         - Gracefully handle any configuration failures
+        
+        The configuration is process-wide, so it only runs for the first
+        client created; later clients skip it.
         """
+        global _UTF8_CONFIGURED
+        if _UTF8_CONFIGURED:
+            return
+        _UTF8_CONFIGURED = True
+        
         import sys
         import locale
         
@@ -249,6 +264,34 @@ class Client:
                     # If locale setting fails, continue anyway
                     pass
 
+    def __enter__(self):
+        """Context manager entry.
+        
+        Returns:
+            Client: The client instance for use in the context
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit.
+        
+        Closes the underlying HTTP session.
+        
+        Args:
+            exc_type: Exception type (if any)
+            exc_val: Exception value (if any)
+            exc_tb: Exception traceback (if any)
+        """
+        self.close()
+
+    def close(self):
+        """Close the HTTP session and release pooled connections.
+        
+        This method should be called when the client is no longer needed
+        if not using the context manager.
+        """
+        self.session.close()
+
     @property
     def chat(self):
         """Access chat completions interface.
@@ -317,25 +360,37 @@ class ChatCompletions:
         else:
             return ""
 
-    def create(self, model: str, messages: List[Message], tool_choice: Optional[Literal["auto", "none", "always"]] = None, thinking_effort: Literal["low", "medium", "high", "none"] = "none", **kwargs) -> Dict[str, Any]:
-        url = f"{self.client.base_url}/chat/completions"
+    def _apply_thinking_effort(self, messages: List[Message], thinking_effort: Optional[Literal["low", "medium", "high", "none"]]) -> None:
+        """Add the thinking instruction for thinking_effort to the messages in place.
+        
+        The instruction is appended to the first system message, or inserted
+        as a new system message at the beginning if there is none.
+        
+        Args:
+            messages: The conversation messages to modify
+            thinking_effort: The level of thinking effort, or None to skip
+        """
+        if not thinking_effort:
+            return
+        thinking_instruction = self._get_thinking_instruction(thinking_effort)
+        if not thinking_instruction:
+            return
+        for msg in messages:
+            if msg.get("role") == "system":
+                # Append thinking instruction to existing system message
+                msg["content"] += " " + thinking_instruction
+                return
+        # Add new system message at the beginning
+        messages.insert(0, {"role": "system", "content": thinking_instruction})
+
+    def create(self, model: str, messages: List[Message], tool_choice: Optional[Literal["auto", "none", "always"]] = None, thinking_effort: Literal["low", "medium", "high", "none"] = "none", stream: bool = False, **kwargs) -> Union[Dict[str, Any], Iterator[Dict[str, Any]]]:
+        url = self.client._url_chat
         data = {"model": model, "messages": messages, **kwargs}
+        if stream:
+            data["stream"] = True
         
         # Handle thinking_effort parameter
-        if thinking_effort:
-            thinking_instruction = self._get_thinking_instruction(thinking_effort)
-            if thinking_instruction:
-                # Check if there's already a system message
-                system_message_exists = any(msg.get("role") == "system" for msg in data["messages"])
-                if system_message_exists:
-                    # Append thinking instruction to existing system message
-                    for msg in data["messages"]:
-                        if msg.get("role") == "system":
-                            msg["content"] += " " + thinking_instruction
-                            break
-                else:
-                    # Add new system message at the beginning
-                    data["messages"].insert(0, {"role": "system", "content": thinking_instruction})
+        self._apply_thinking_effort(data["messages"], thinking_effort)
         
         # Convert OpenAI vision format to Docker Model Runner format
         for message in data["messages"]:
@@ -391,35 +446,12 @@ class ChatCompletions:
             data["tools"] = function_tools
         
         # Handle tool_choice locally
-        if tool_choice == "none":
-            data.pop("tools", None)
-        elif tool_choice == "always":
-            if "tools" in data:
-                tool_names = []
-                for tool in data["tools"]:
-                    if tool.get("type") == "function":
-                        name = tool["function"]["name"]
-                        if name in mcp_tools:
-                            # Use actual tool name, not server label
-                            tool_names.append(name)
-                        else:
-                            tool_names.append(name)
-                if tool_names:  # Only modify if there are tools
-                    tool_names_str = ", ".join(tool_names)
-                    # Modify the last user message
-                    for msg in reversed(data["messages"]):
-                        if msg["role"] == "user":
-                            msg["content"] += f" Use one of these tools: {tool_names_str}. Choose the most appropriate tool and provide only the tool call, no additional text."
-                            break
-        elif tool_choice == "auto":
-            # Send tools and let model decide (default behavior)
-            pass
-        # Remove tool_choice from data as server doesn't support it
-        data.pop("tool_choice", None)
-        
-        if kwargs.get("stream", False):
-            return Stream(self._stream_response(url, data))
-        response = self.client.session.post(url, json=data)
+        _apply_tool_choice(data, tool_choice)
+        
+        if stream:
+            # _stream_response is already a generator, so return it directly
+            return self._stream_response(url, data)
+        response = self.client.session.post(url, content=orjson.dumps(data), headers=_JSON_HEADERS)
         response.raise_for_status()
         result = response.json()
         
@@ -502,7 +534,7 @@ Remember: Return ONLY the JSON object, nothing else. This format works for ALL M
                     follow_up_data = {"model": model, "messages": follow_up_messages}
                     if "response_format" in kwargs:
                         follow_up_data["response_format"] = kwargs["response_format"]
-                    follow_up_response = self.client.session.post(url, json=follow_up_data)
+                    follow_up_response = self.client.session.post(url, content=orjson.dumps(follow_up_data), headers=_JSON_HEADERS)
                     follow_up_response.raise_for_status()
                     result = follow_up_response.json()
 
@@ -519,70 +551,69 @@ Remember: Return ONLY the JSON object, nothing else. This format works for ALL M
 
     def stream(self, model: str, messages: List[Message], **kwargs) -> Iterator[Dict[str, Any]]:
         """Stream method that yields chunks and accumulates reasoning content properly"""
-        url = f"{self.client.base_url}/chat/completions"
+        url = self.client._url_chat
         data = {"model": model, "messages": messages, "stream": True, **kwargs}
         
         # Handle thinking_effort parameter for streaming
         thinking_effort = kwargs.get("thinking_effort", "none")
-        if thinking_effort:
-            thinking_instruction = self._get_thinking_instruction(thinking_effort)
-            if thinking_instruction:
-                # Check if there's already a system message
-                system_message_exists = any(msg.get("role") == "system" for msg in data["messages"])
-                if system_message_exists:
-                    # Append thinking instruction to existing system message
-                    for msg in data["messages"]:
-                        if msg.get("role") == "system":
-                            msg["content"] += " " + thinking_instruction
-                            break
-                else:
-                    # Add new system message at the beginning
-                    data["messages"].insert(0, {"role": "system", "content": thinking_instruction})
-            # Remove thinking_effort from kwargs as it's not a server parameter
-            kwargs.pop("thinking_effort", None)
-        
-        # First yield all streaming chunks
+        self._apply_thinking_effort(data["messages"], thinking_effort)
+        # Remove thinking_effort from kwargs as it's not a server parameter
+        kwargs.pop("thinking_effort", None)
+        
+        # First yield all streaming chunks, collecting their deltas
+        accumulator = _StreamAccumulator()
         for chunk in self._stream_response(url, data):
+            accumulator.add(chunk)
             yield chunk
         
-        # Then yield the full response (non-streaming) to get complete reasoning content
-        data_no_stream = {**data}
-        data_no_stream.pop('stream', None)  # Remove stream parameter if present
-        response = self.client.session.post(url, json=data_no_stream)
-        response.raise_for_status()
-        full_response = response.json()
-        yield full_response
+        # Then yield the full response, rebuilt locally instead of re-running the generation
+        yield accumulator.build(model)
+
+    def stream_text(self, model: str, messages: List[Message], thinking_effort: Literal["low", "medium", "high", "none"] = "none", **kwargs) -> Iterator[str]:
+        """Stream only the text deltas of a chat completion.
+        
+        Unlike stream(), chunks are not returned as dicts. When msgspec is
+        installed each chunk is decoded straight into a small typed struct,
+        skipping every field except the delta content.
+        
+        Args:
+            model: The model identifier to use
+            messages: The conversation messages
+            thinking_effort: The level of thinking effort, applied to the
+                messages the same way as in create() and stream()
+            **kwargs: Additional parameters for the API request
+            
+        Yields:
+            str: The content delta of each chunk ("" for chunks without text)
+            
+        Example:
+            >>> for text in client.chat.completions.stream_text(
+            ...     model="ai/model_name",
+            ...     messages=[{"role": "user", "content": "Hello!"}]
+            ... ):
+            ...     print(text, end="", flush=True)
+        """
+        url = self.client._url_chat
+        self._apply_thinking_effort(messages, thinking_effort)
+        data = {"model": model, "messages": messages, **kwargs, "stream": True}
+        if MSGSPEC_AVAILABLE:
+            for chunk in self._stream_response(url, data, decode=_CHAT_CHUNK_DECODER.decode):
+                if chunk.choices:
+                    yield chunk.choices[0].delta.content or ""
+        else:
+            for chunk in self._stream_response(url, data):
+                choices = chunk.get("choices")
+                if choices:
+                    yield choices[0].get("delta", {}).get("content") or ""
 
-    def _stream_response(self, url: str, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
-        with self.client.session.post(url, json=data, stream=True) as response:
+    def _stream_response(self, url: str, data: Dict[str, Any], decode: Callable[[bytes], Any] = orjson.loads) -> Iterator[Any]:
+        with self.client.session.stream("POST", url, content=orjson.dumps(data), headers=_JSON_HEADERS) as response:
             response.raise_for_status()
-            # Ensure proper encoding
-            response.encoding = 'utf-8'
-            buffer = ""
-            for chunk in response.iter_content(chunk_size=1024):
-                # Explicitly decode as UTF-8
-                decoded_chunk = chunk.decode('utf-8', errors='replace')
-                buffer += decoded_chunk
-                lines = buffer.split('\n')
-                buffer = lines.pop()
-                for line in lines:
-                    line = line.strip()
-                    if line:
-                        if line.startswith('data: '):
-                            data_str = line[6:]
-                            if data_str == '[DONE]':
-                                return
-                            try:
-                                chunk_data = json.loads(data_str)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                continue
-                        else:
-                            try:
-                                chunk_data = json.loads(line)
-                                yield chunk_data
-                            except json.JSONDecodeError:
-                                continue
+            parser = _SSEParser(decode)
+            for chunk in response.iter_bytes():
+                yield from parser.feed(chunk)
+                if parser.done:
+                    return
 
 class Completions:
     """Text completions interface for sync client.
@@ -619,9 +650,9 @@ class Completions:
             ... )
             >>> print(response["choices"][0]["text"])
         """
-        url = f"{self.client.base_url}/completions"
+        url = self.client._url_completions
         data = {"model": model, "prompt": prompt, **kwargs}
-        response = self.client.session.post(url, json=data)
+        response = self.client.session.post(url, content=orjson.dumps(data), headers=_JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
@@ -660,12 +691,46 @@ class Embeddings:
             ... )
             >>> embeddings = response["data"]
         """
-        url = f"{self.client.base_url}/embeddings"
+        url = self.client._url_embeddings
         data = {"model": model, "input": input, **kwargs}
-        response = self.client.session.post(url, json=data)
+        response = self.client.session.post(url, content=orjson.dumps(data), headers=_JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
+    def create_batch(self, model: str, inputs: List[str], batch_size: int = 64, max_workers: int = 8, **kwargs) -> List[Dict[str, Any]]:
+        """Create embeddings for many texts using batched requests on a thread pool.
+        
+        The inputs are split into batches of ``batch_size`` texts, and up to
+        ``max_workers`` batches are sent to the server at the same time. The
+        shared httpx.Client is thread-safe and its pool allows 64 connections.
+        
+        Args:
+            model: The embedding model identifier to use
+            inputs: List of text strings to embed
+            batch_size: Maximum number of texts sent in a single request
+            max_workers: Maximum number of requests in flight at once
+            **kwargs: Additional parameters for each API request
+            
+        Returns:
+            List of embedding objects in the same order as ``inputs``, with
+            each ``index`` referring to the position in ``inputs``
+            
+        Example:
+            >>> embeddings = client.embeddings.create_batch(
+            ...     model="ai/embedding-model",
+            ...     inputs=["first text", "second text", "third text"]
+            ... )
+            >>> vectors = [item["embedding"] for item in embeddings]
+        """
+        batches = [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
+        # Executor.map yields results in submission order, so they line up with inputs
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(lambda batch: self.create(model=model, input=batch, **kwargs), batches))
+        embeddings = [item for result in results for item in result["data"]]
+        for index, item in enumerate(embeddings):
+            item["index"] = index
+        return embeddings
+
 class Models:
     """Model management interface for sync client.
     
@@ -694,7 +759,7 @@ class Models:
             >>> for model in models["data"]:
             ...     print(model["id"])
         """
-        url = f"{self.client.base_url}/models"
+        url = self.client._url_models
         response = self.client.session.get(url)
         response.raise_for_status()
         return response.json()
@@ -712,7 +777,7 @@ class Models:
             >>> model_info = client.models.retrieve("ai/model_name")
             >>> print(model_info["description"])
         """
-        url = f"{self.client.base_url}/models/{model}"
+        url = f"{self.client._url_models}/{model}"
         response = self.client.session.get(url)
         response.raise_for_status()
         return response.json()
@@ -731,10 +796,9 @@ class Models:
             This method uses the Docker Model Runner management API,
             not the standard OpenAI models endpoint.
         """
-        base = self.client.base_url.replace("/engines/llama.cpp/v1", "")
-        url = f"{base}/models/create"
+        url = f"{self.client._url_models_root}/create"
         data = {"model": model, **kwargs}
-        response = self.client.session.post(url, json=data)
+        response = self.client.session.post(url, content=orjson.dumps(data), headers=_JSON_HEADERS)
         response.raise_for_status()
         return response.json()
 
@@ -751,8 +815,7 @@ class Models:
             This method uses the Docker Model Runner management API,
             not the standard OpenAI models endpoint.
         """
-        base = self.client.base_url.replace("/engines/llama.cpp/v1", "")
-        url = f"{base}/models/{model}"
+        url = f"{self.client._url_models_root}/{model}"
         response = self.client.session.delete(url)
         response.raise_for_status()
         return response.json()
\ No newline at end of file